@@ -12,14 +12,13 @@ import abc
 import copy
 import datetime
 import functools
+import os
 import sys
 from contextlib import contextmanager
-from pathlib import Path, PurePath
+from pathlib import Path
 
 import asdf
-import numpy as np
 from asdf.exceptions import ValidationError
-from asdf.tags.core.ndarray import NDArrayType
 from astropy.time import Time
 
 from roman_datamodels import stnode, validate
@@ -28,6 +27,12 @@ __all__ = ["DataModel", "MODEL_REGISTRY"]
 
 MODEL_REGISTRY = {}
 
+# Map of tag_uri to the schema_uri for each tag in the datamodels extension
+_SCHEMA_URI_BY_TAG = {tag.tag_uri: tag.schema_uris[0] for tag in stnode.NODE_EXTENSIONS[0].tags}
+
+# Value types which can be passed to CRDS
+_SCALAR_TYPES = (str, int, float, complex, bool)
+
 
 def _set_default_asdf(func):
     """
@@ -75,8 +80,14 @@ def _temporary_update_filename(datamodel, filename):
 class DataModel(abc.ABC):
     """Base class for all top level datamodels"""
 
+    # Attributes stored on the model itself rather than on the wrapped node
+    __slots__ = ("__weakref__", "_asdf", "_ctx", "_files_to_close", "_instance", "_iscopy", "_shape")
+
     crds_observatory = "roman"
 
+    # Name of the "primary" array, subclasses set this if it is not "data"
+    _primary_array_name = None
+
     @abc.abstractproperty
     def _node_type(self):
         """Define the top-level node type for this model"""
@@ -140,11 +151,8 @@ class DataModel(abc.ABC):
         if init is None:
             self._instance = self._node_type()
 
-        elif isinstance(init, (str, bytes, PurePath)):
-            if isinstance(init, PurePath):
-                init = str(init)
-            if isinstance(init, bytes):
-                init = init.decode(sys.getfilesystemencoding())
+        elif isinstance(init, (str, bytes, os.PathLike)):
+            init = os.fsdecode(init)
 
             self._asdf = self.open_asdf(init, **kwargs)
             if not self.check_type(self._asdf):
@@ -162,15 +170,15 @@ class DataModel(abc.ABC):
         """
         Subclass is expected to check for proper type of node
         """
-        if "roman" not in asdf_file.tree:
-            raise ValueError('ASDF file does not have expected "roman" attribute')
+        if (roman := asdf_file.tree.get("roman")) is None:
+            return False
 
-        return MODEL_REGISTRY[asdf_file.tree["roman"].__class__] == self.__class__
+        return MODEL_REGISTRY.get(roman.__class__) is self.__class__
 
     @property
     def schema_uri(self):
         # Determine the schema corresponding to this model's tag
-        return next(t for t in stnode.NODE_EXTENSIONS[0].tags if t.tag_uri == self._instance._tag).schema_uris[0]
+        return _SCHEMA_URI_BY_TAG[self._instance._tag]
 
     def close(self):
         if not (self._iscopy or self._asdf is None):
@@ -187,17 +195,33 @@ class DataModel(abc.ABC):
         self.close()
 
     def copy(self, deepcopy=True, memo=None):
-        result = self.__class__(init=None)
+        # Skip __init__ as it would build an empty node that clone immediately replaces
+        result = self.__class__.__new__(self.__class__)
+
+        # Make sure close() works on the result even if clone fails part way through
+        result._iscopy = True
+        result._asdf = None
         self.clone(result, self, deepcopy=deepcopy, memo=memo)
         return result
 
-    __copy__ = __deepcopy__ = copy
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy(deepcopy=True, memo=memo)
 
     @staticmethod
     def clone(target, source, deepcopy=False, memo=None):
         if deepcopy:
-            target._asdf = source._asdf.copy()
-            target._instance = copy.deepcopy(source._instance, memo=memo)
+            target._asdf = None if source._asdf is None else source._asdf.copy()
+
+            # The asdf copy has already deep copied the tree, so reuse its node
+            #   rather than deep copying the (potentially large) node a second time
+            if target._asdf is not None and source._asdf.tree.get("roman") is source._instance:
+                target._instance = target._asdf.tree["roman"]
+                if memo is not None:
+                    memo[id(source._instance)] = target._instance
+            else:
+                target._instance = copy.deepcopy(source._instance, memo=memo)
         else:
             target._asdf = source._asdf
             target._instance = source._instance
@@ -229,20 +253,43 @@ class DataModel(abc.ABC):
 
             return asdf.AsdfFile(init, **kwargs)
 
-    def to_asdf(self, init, *args, **kwargs):
+    def to_asdf(self, init, *args, all_array_compression="input", compression_kwargs=None, **kwargs):
+        """
+        Write the model to an ASDF file.
+
+        Parameters
+        ----------
+        init : str or path-like
+            The file to write to.
+        all_array_compression : str
+            Block compression applied to all arrays, e.g. ``"zlib"``, ``"bzp2"``
+            or ``"lz4"`` (requires the ``lz4`` package). The default, ``"input"``,
+            keeps the compression each array was read with.
+        compression_kwargs : dict, optional
+            Keyword arguments passed to the compressor.
+        **kwargs
+            Any additional arguments to pass to ``asdf.AsdfFile`` and its
+            ``write_to`` method.
+        """
         with validate.nuke_validation(), _temporary_update_filename(self, Path(init).name):
             asdf_file = self.open_asdf(**kwargs)
             asdf_file["roman"] = self._instance
-            asdf_file.write_to(init, *args, **kwargs)
+            asdf_file.write_to(
+                init, *args, all_array_compression=all_array_compression, compression_kwargs=compression_kwargs, **kwargs
+            )
 
     def get_primary_array_name(self):
         """
         Returns the name "primary" array for this model, which
         controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
+        Subclasses set the ``_primary_array_name`` class attribute if the
+        primary array's name is not "data". Otherwise this is "data", or
+        an empty string if the model has no "data" array.
         """
-        return "data" if hasattr(self, "data") else ""
+        if self._primary_array_name is not None:
+            return self._primary_array_name
+
+        return "data" if hasattr(self._instance, "data") else ""
 
     @property
     def override_handle(self):
@@ -255,19 +302,25 @@ class DataModel(abc.ABC):
     @property
     def shape(self):
         if self._shape is None:
+            # Look up the array on the node directly to skip the __getattr__ delegation
             primary_array_name = self.get_primary_array_name()
-            if primary_array_name and hasattr(self, primary_array_name):
-                primary_array = getattr(self, primary_array_name)
+            primary_array = getattr(self._instance, primary_array_name, None) if primary_array_name else None
+            if primary_array is not None:
                 self._shape = primary_array.shape
         return self._shape
 
     def __setattr__(self, attr, value):
         if attr.startswith("_"):
-            self.__dict__[attr] = value
+            object.__setattr__(self, attr, value)
         else:
             setattr(self._instance, attr, value)
 
     def __getattr__(self, attr):
+        # Only reached for unset slots or attributes of the wrapped node, an
+        #   unset slot must not be delegated as that recurses through _instance
+        if attr in DataModel.__slots__:
+            raise AttributeError(f"{self.__class__.__name__} has no attribute {attr}")
+
         return getattr(self._instance, attr)
 
     def __setitem__(self, key, value):
@@ -302,13 +355,9 @@ class DataModel(abc.ABC):
                 return str(val)
             return val
 
-        return {
-            f"roman.{key}": convert_val(val)
-            for (key, val) in self.items()
-            if include_arrays or not isinstance(val, (np.ndarray, NDArrayType))
-        }
+        return {f"roman.{key}": convert_val(val) for (key, val) in self.items(skip_arrays=not include_arrays)}
 
-    def items(self):
+    def items(self, skip_arrays=False):
         """
         Iterates over all of the model items in a flat way.
 
@@ -320,9 +369,14 @@ class DataModel(abc.ABC):
 
         Unlike the JWST DataModel implementation, this does not use
         schemas directly.
+
+        Parameters
+        ----------
+        skip_arrays : bool
+            If True, array values are not yielded (default: False)
         """
 
-        yield from self._instance._recursive_items()
+        yield from self._instance._recursive_items(skip_arrays=skip_arrays)
 
     def get_crds_parameters(self):
         """
@@ -337,7 +391,7 @@ class DataModel(abc.ABC):
         return {
             f"roman.meta.{key}": val
             for key, val in self.meta.to_flat_dict(include_arrays=False, recursive=True).items()
-            if isinstance(val, (str, int, float, complex, bool))
+            if isinstance(val, _SCALAR_TYPES)
         }
 
     def validate(self):
@@ -26,6 +26,8 @@ class _DataModel(DataModel):
         documentation generation to work properly.
     """
 
+    __slots__ = ()
+
     def __init_subclass__(cls, **kwargs):
         """Register each subclass in the __all__ for this module"""
         super().__init_subclass__(**kwargs)
@@ -41,6 +43,8 @@ class _DataModel(DataModel):
 
 
 class _RomanDataModel(_DataModel):
+    __slots__ = ()
+
     def __init__(self, init=None, **kwargs):
         super().__init__(init, **kwargs)
 
@@ -49,6 +53,7 @@ class _RomanDataModel(_DataModel):
 
 
 class MosaicModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.WfiMosaic
 
     def append_individual_image_meta(self, meta):
@@ -124,18 +129,22 @@ class MosaicModel(_RomanDataModel):
 
 
 class ImageModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.WfiImage
 
 
 class ScienceRawModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.WfiScienceRaw
 
 
 class MsosStackModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.MsosStack
 
 
 class RampModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.Ramp
 
     @classmethod
@@ -199,10 +208,13 @@ class RampModel(_RomanDataModel):
 
 
 class RampFitOutputModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.RampFitOutput
 
 
 class AssociationsModel(_DataModel):
+    __slots__ = ()
+
     # Need an init to allow instantiation from a JSON file
     _node_type = stnode.Associations
 
@@ -220,123 +232,123 @@ class AssociationsModel(_DataModel):
 
 
 class GuidewindowModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.Guidewindow
 
 
 class FlatRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.FlatRef
 
 
 class AbvegaoffsetRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.AbvegaoffsetRef
 
 
 class ApcorrRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.ApcorrRef
 
 
 class DarkRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.DarkRef
 
 
 class DistortionRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.DistortionRef
 
 
 class EpsfRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.EpsfRef
 
 
 class GainRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.GainRef
 
 
 class IpcRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.IpcRef
 
 
 class LinearityRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.LinearityRef
-
-    def get_primary_array_name(self):
-        """
-        Returns the name "primary" array for this model, which
-        controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
-        """
-        return "coeffs"
+    _primary_array_name = "coeffs"
 
 
 class InverselinearityRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.InverselinearityRef
-
-    def get_primary_array_name(self):
-        """
-        Returns the name "primary" array for this model, which
-        controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
-        """
-        return "coeffs"
+    _primary_array_name = "coeffs"
 
 
 class MaskRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.MaskRef
-
-    def get_primary_array_name(self):
-        """
-        Returns the name "primary" array for this model, which
-        controls the size of other arrays that are implicitly created.
-        This is intended to be overridden in the subclasses if the
-        primary array's name is not "data".
-        """
-        return "dq"
+    _primary_array_name = "dq"
 
 
 class PixelareaRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.PixelareaRef
 
 
 class ReadnoiseRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.ReadnoiseRef
 
 
 class SuperbiasRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.SuperbiasRef
 
 
 class SaturationRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.SaturationRef
 
 
 class WfiImgPhotomRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.WfiImgPhotomRef
 
 
 class RefpixRefModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.RefpixRef
 
 
 class FpsModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.Fps
 
 
 class TvacModel(_DataModel):
+    __slots__ = ()
     _node_type = stnode.Tvac
 
 
 class MosaicSourceCatalogModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.MosaicSourceCatalog
 
 
 class MosaicSegmentationMapModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.MosaicSegmentationMap
 
 
 class SourceCatalogModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.SourceCatalog
 
 
 class SegmentationMapModel(_RomanDataModel):
+    __slots__ = ()
     _node_type = stnode.SegmentationMap
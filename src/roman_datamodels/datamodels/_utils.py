@@ -104,8 +104,9 @@ def rdm_open(init, memmap=False, **kwargs):
             del kwargs["asn_n_members"]
 
         asdf_file = init if isinstance(init, asdf.AsdfFile) else _open_path_like(init, memmap=memmap, **kwargs)
-        if (model_type := type(asdf_file.tree["roman"])) in MODEL_REGISTRY:
-            return MODEL_REGISTRY[model_type](asdf_file, **kwargs)
+        model_type = type(asdf_file.tree["roman"])
+        if (model := MODEL_REGISTRY.get(model_type)) is not None:
+            return model(asdf_file, **kwargs)
 
         asdf_file.close()
         raise TypeError(f"Unknown datamodel type: {model_type}")
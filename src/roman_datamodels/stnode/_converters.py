@@ -2,6 +2,8 @@
 The ASDF Converters to handle the serialization/deseialization of the STNode classes to ASDF.
 """
 
+from functools import cache
+
 from asdf.extension import Converter, ManifestExtension
 from astropy.time import Time
 
@@ -15,6 +17,18 @@ __all__ = [
 ]
 
 
+@cache
+def _time_scalar_tags():
+    """
+    The tags of the tagged scalars which wrap an astropy Time.
+        These are computed once on first use because the classes are only created
+        dynamically when _stnode is imported.
+    """
+    from ._stnode import FileDate, FpsFileDate, TvacFileDate
+
+    return frozenset((FileDate._tag, FpsFileDate._tag, TvacFileDate._tag))
+
+
 class _RomanConverter(Converter):
     """
     Base class for the roman_datamodels converters.
@@ -98,20 +112,16 @@ class TaggedScalarNodeConverter(_RomanConverter):
         return obj.tag
 
     def to_yaml_tree(self, obj, tag, ctx):
-        from ._stnode import FileDate, FpsFileDate, TvacFileDate
-
         node = obj.__class__.__bases__[0](obj)
 
-        if tag in (FileDate._tag, FpsFileDate._tag, TvacFileDate._tag):
+        if tag in _time_scalar_tags():
             converter = ctx.extension_manager.get_converter_for_type(type(node))
             node = converter.to_yaml_tree(node, tag, ctx)
 
         return node
 
     def from_yaml_tree(self, node, tag, ctx):
-        from ._stnode import FileDate, FpsFileDate, TvacFileDate
-
-        if tag in (FileDate._tag, FpsFileDate._tag, TvacFileDate._tag):
+        if tag in _time_scalar_tags():
             converter = ctx.extension_manager.get_converter_for_type(Time)
             node = converter.from_yaml_tree(node, tag, ctx)
 
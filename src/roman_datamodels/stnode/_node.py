@@ -28,6 +28,9 @@ __all__ = ["DNode", "LNode"]
 validator_callbacks = HashableDict(asdfschema.YAML_VALIDATORS)
 validator_callbacks.update({"type": _check_type})
 
+# Types treated as arrays when flattening nodes
+_ARRAY_TYPES = (np.ndarray, ndarray.NDArrayType)
+
 
 def _value_change(path, value, schema, pass_invalid_values, strict_validation, ctx):
     """
@@ -133,7 +136,7 @@ class SchemaProperties:
         Extend the current SchemaProperties with those from another instance.
         """
         self.explicit_properties = set(self.explicit_properties).union(other.explicit_properties)
-        self.patterns.update(other.patterns)
+        self.patterns = {**self.patterns, **other.patterns}
 
     @classmethod
     def from_schema(cls, schema):
@@ -266,18 +269,20 @@ class DNode(MutableMapping):
             self._x_schema_attributes = SchemaProperties.from_schema(self._schema())
         return self._x_schema_attributes
 
-    def _recursive_items(self):
-        def recurse(tree, path=[]):
+    def _recursive_items(self, skip_arrays=False):
+        # Walk the tree with an explicit stack rather than nested generators,
+        #   children are pushed in reverse so that items are yielded in order
+        stack = [(self, ())]
+        while stack:
+            tree, path = stack.pop()
             if isinstance(tree, (DNode, dict, AsdfDictNode)):
-                for key, val in tree.items():
-                    yield from recurse(val, path + [key])
+                stack.extend((val, (*path, key)) for key, val in reversed(list(tree.items())))
             elif isinstance(tree, (LNode, list, tuple, AsdfListNode)):
-                for i, val in enumerate(tree):
-                    yield from recurse(val, path + [i])
+                stack.extend((val, (*path, i)) for i, val in reversed(list(enumerate(tree))))
             elif tree is not None:
-                yield (".".join(str(x) for x in path), tree)
-
-        yield from recurse(self)
+                if skip_arrays and isinstance(tree, _ARRAY_TYPES):
+                    continue
+                yield (".".join(map(str, path)), tree)
 
     def to_flat_dict(self, include_arrays=True, recursive=False):
         """
@@ -301,14 +306,12 @@ class DNode(MutableMapping):
                 return str(val)
             return val
 
-        item_getter = self._recursive_items if recursive else self.items
-
-        if include_arrays:
-            return {key: convert_val(val) for (key, val) in item_getter()}
+        if recursive:
+            return {key: convert_val(val) for (key, val) in self._recursive_items(skip_arrays=not include_arrays)}
+        elif include_arrays:
+            return {key: convert_val(val) for (key, val) in self.items()}
         else:
-            return {
-                key: convert_val(val) for (key, val) in item_getter() if not isinstance(val, (np.ndarray, ndarray.NDArrayType))
-            }
+            return {key: convert_val(val) for (key, val) in self.items() if not isinstance(val, _ARRAY_TYPES)}
 
     def _schema(self):
         """
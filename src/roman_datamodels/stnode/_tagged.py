@@ -5,6 +5,7 @@ Base classes for all the tagged objects defined by RAD.
 """
 
 import copy
+from functools import cache
 
 import asdf
 
@@ -39,6 +40,20 @@ def get_schema_from_tag(ctx, tag):
     return asdf.schema.load_schema(schema_uri, resolve_references=True)
 
 
+@cache
+def _cached_schema_from_tag(tag):
+    """
+    Look up and load the schema for a tag once, sharing it between all nodes
+    with that tag. The returned schema must be treated as read-only.
+
+    Parameters
+    ----------
+    tag : str
+        The tag_uri of the schema to load.
+    """
+    return get_schema_from_tag(asdf.AsdfFile(), tag)
+
+
 def name_from_tag_uri(tag_uri):
     """
     Compute the name of the schema from the tag_uri.
@@ -80,7 +95,7 @@ class TaggedObjectNode(DNode):
 
     def _schema(self):
         if self._x_schema is None:
-            self._x_schema = self.get_schema()
+            self._x_schema = _cached_schema_from_tag(self._tag)
         return self._x_schema
 
     def get_schema(self):
@@ -1,4 +1,5 @@
 import os
+from functools import cache
 
 import asdf
 import pytest
@@ -7,6 +8,14 @@ import yaml
 MANIFEST = yaml.safe_load(asdf.get_config().resource_manager["asdf://stsci.edu/datamodels/roman/manifests/datamodels-1.0"])
 
 
+@cache
+def load_schema(schema_uri, resolve_references=False):
+    """
+    Load a schema only once per test session, the result must not be modified.
+    """
+    return asdf.schema.load_schema(schema_uri, resolve_references=resolve_references)
+
+
 @pytest.fixture(scope="session")
 def manifest():
     return MANIFEST
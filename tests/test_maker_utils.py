@@ -12,6 +12,8 @@ from roman_datamodels.datamodels._datamodels import _RomanDataModel
 from roman_datamodels.maker_utils import _ref_files as ref_files
 from roman_datamodels.testing import assert_node_equal
 
+from .conftest import load_schema
+
 
 @pytest.mark.parametrize("node_class", stnode.NODE_CLASSES)
 def test_maker_utility_implemented(node_class):
@@ -47,7 +49,7 @@ def test_no_extra_fields(node_class, manifest):
     instance_keys = set(instance.keys())
 
     schema_uri = next(t["schema_uri"] for t in manifest["tags"] if t["tag_uri"] == instance.tag)
-    schema = asdf.schema.load_schema(schema_uri, resolve_references=True)
+    schema = load_schema(schema_uri, resolve_references=True)
 
     schema_keys = set()
     subschemas = [schema]
@@ -1,3 +1,4 @@
+import copy
 import json
 import os
 from pathlib import Path
@@ -75,6 +76,8 @@ def test_model_input(tmp_path):
     # It's essential that we get a new instance so that the original
     # model can be closed without impacting the new model.
     assert reopened_model is not original_model
+    # but the underlying data should not be copied
+    assert reopened_model._instance is original_model._instance
 
     assert_array_equal(original_model.data, data)
     original_model.close()
@@ -82,6 +85,41 @@ def test_model_input(tmp_path):
     reopened_model.close()
 
 
+@pytest.mark.parametrize("path_type", [Path, str, os.fsencode])
+def test_model_path_like_init(tmp_path, path_type):
+    file_path = tmp_path / "testreadnoise.asdf"
+    utils.mk_readnoise(shape=(8, 8), filepath=file_path)
+
+    with datamodels.ReadnoiseRefModel(path_type(file_path)) as model:
+        assert model.meta.reftype == "READNOISE"
+
+
+def test_deepcopy_opened_model(tmp_path):
+    file_path = tmp_path / "testreadnoise.asdf"
+    utils.mk_readnoise(shape=(8, 8), filepath=file_path)
+
+    with datamodels.open(file_path) as model:
+        model_copy = model.copy()
+
+        # The copied model should wrap the node held by its own copy of the asdf file
+        assert model_copy._instance is model_copy._asdf.tree["roman"]
+        assert model_copy._instance is not model._instance
+        assert_node_equal(model_copy._instance, model._instance)
+
+
+def test_copy_module_deepcopy_opened_model(tmp_path):
+    file_path = tmp_path / "testreadnoise.asdf"
+    utils.mk_readnoise(shape=(8, 8), filepath=file_path)
+
+    with datamodels.open(file_path) as model:
+        memo = {}
+        model_copy = copy.deepcopy(model, memo)
+
+        assert model_copy._instance is not model._instance
+        assert memo[id(model._instance)] is model_copy._instance
+        assert_node_equal(model_copy._instance, model._instance)
+
+
 def test_invalid_input():
     with pytest.raises(TypeError):
         datamodels.open(fits.HDUList())
@@ -242,6 +280,21 @@ def test_rdm_open_non_datamodel():
         rdm_open(Path(__file__).parent / "data" / "not_a_datamodel.asdf")
 
 
+@pytest.mark.parametrize(
+    "tree",
+    [
+        {"other": 42},  # no roman node
+        {"roman": np.zeros((5, 5))},  # roman node is not a registered datamodel node
+    ],
+)
+def test_model_init_wrong_type(tmp_path, tree):
+    file_path = tmp_path / "test.asdf"
+    asdf.AsdfFile(tree).write_to(file_path)
+
+    with pytest.raises(ValueError, match=r"ASDF file is not of the type expected"):
+        datamodels.ReadnoiseRefModel(file_path)
+
+
 def test_open_asn(tmp_path):
     romancal = pytest.importorskip("romancal")
 
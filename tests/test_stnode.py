@@ -3,6 +3,7 @@ from contextlib import nullcontext
 
 import asdf
 import astropy.units as u
+import numpy as np
 import pytest
 from asdf.exceptions import ValidationError
 
@@ -226,6 +227,14 @@ def test_node_new_attribute_assignment():
         photmod.phot_table.F106 = 0
 
 
+def test_recursive_items():
+    """Test that nested items are flattened in order with dot-separated keys"""
+    node = stnode.DNode({"a": 1, "b": {"c": [2, {"d": 3}], "e": None}, "f": (4, 5), "g": np.zeros(2)})
+
+    assert [key for key, _ in node._recursive_items()] == ["a", "b.c.0", "b.c.1.d", "f.0", "f.1", "g"]
+    assert list(node._recursive_items(skip_arrays=True)) == [("a", 1), ("b.c.0", 2), ("b.c.1.d", 3), ("f.0", 4), ("f.1", 5)]
+
+
 VALIDATION_CASES = ("true", "yes", "1", "True", "Yes", "TrUe", "YeS", "foo", "Bar", "BaZ")
 
 